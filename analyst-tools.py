@@ -1,7 +1,9 @@
 from mcp.server.fastmcp import FastMCP
+import numpy as np
 import pandas as pd
-from thefuzz import process
+from rapidfuzz import process, fuzz, utils
 import os
+from functools import lru_cache
 from typing import Optional, Tuple, List, Dict, Union
 from mcp.server.fastmcp.prompts import base
 import asyncio
@@ -10,36 +12,241 @@ host = os.getenv("MCP_HOST", "0.0.0.0")
 port = os.getenv("MCP_PORT", 8000)
 mcp = FastMCP("Analyst Tools", host=host, port=port)
 
+# Optional numba-backed grouped aggregation (install with the 'numba' extra).
+# Only worth it for large datasets: the reducer is JIT-compiled on first use
+# (pandas caches it afterwards), so below the row threshold the compile cost
+# would dominate and the default Cython kernel is used instead.
+try:
+    import numba  # noqa: F401
+    _HAS_NUMBA = True
+except ImportError:
+    _HAS_NUMBA = False
+
+_NUMBA_MIN_ROWS = 100_000
+
+
+def _numba_sum(values, index):
+    """
+    Reducer handed to GroupBy.agg's numba engine. Must be a module-level
+    function: pandas caches the compiled aggregator keyed on the user
+    function object, so a fresh lambda per call would recompile every time.
+    """
+    return values.sum()
+
+# The only dataset columns the tools ever touch; everything else is skipped
+# at parse time. Float32 is plenty of precision for these financial sums and
+# halves the bandwidth of the aggregation kernels.
+_DATASET_COLUMNS = ['CustomerName', 'ProjectName', 'Revenue', 'COGS', 'OPEX']
+_DATASET_DTYPES = {
+    'CustomerName': 'category',
+    'ProjectName': 'category',
+    'Revenue': 'float32',
+    'COGS': 'float32',
+    'OPEX': 'float32',
+}
+
+# Metrics the tools can compute; served by metrics://available and used to
+# validate requests.
+_AVAILABLE_METRICS = ['revenue', 'gross_margin', 'ebitda']
+
+# Resolved once at import; per-call dirname/abspath/join work is needless
+# path (and potentially filesystem) churn on the request path.
+_CSV_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "dataset.csv")
+
+
+def _dataset_key() -> Tuple[str, float]:
+    """
+    (path, mtime) cache key for dataset.csv as it currently exists on disk;
+    every derived cache below is keyed on it so a modified file invalidates
+    everything at once.
+    """
+    return _CSV_PATH, os.path.getmtime(_CSV_PATH)
+
+
+@lru_cache(maxsize=1)
+def _load_df(csv_path: str, mtime: float) -> pd.DataFrame:
+    """
+    Parse the dataset once per (path, mtime); repeated calls with an unchanged
+    file are served from the cache instead of re-reading the CSV.
+
+    A Parquet sidecar is kept next to the CSV: when it is at least as new as
+    the CSV it is loaded instead (typed and columnar, so no text tokenization
+    or dtype inference), otherwise it is rewritten after the CSV parse so the
+    next cold start skips CSV parsing entirely. Requires the 'parquet' extra;
+    without pyarrow the loader just falls back to CSV.
+    """
+    parquet_path = os.path.splitext(csv_path)[0] + ".parquet"
+    if os.path.exists(parquet_path) and os.path.getmtime(parquet_path) >= mtime:
+        try:
+            return pd.read_parquet(parquet_path, columns=_DATASET_COLUMNS)
+        except ImportError:
+            pass
+    # usecols lets the tokenizer skip unused columns; the explicit dtypes
+    # avoid row-by-row inference and give categorical name columns, so
+    # equality filters and groupby operate on integer codes instead of
+    # hashing Python strings per row.
+    df = pd.read_csv(csv_path, usecols=_DATASET_COLUMNS, dtype=_DATASET_DTYPES,
+                     engine='c')
+    try:
+        df.to_parquet(parquet_path, compression='snappy')
+    except (ImportError, OSError):
+        pass
+    return df
+
+
+def _get_df() -> pd.DataFrame:
+    """
+    Returns the cached dataset DataFrame, reloading it only when dataset.csv
+    has been modified on disk.
+    """
+    return _load_df(*_dataset_key())
+
+
+@lru_cache(maxsize=1)
+def _build_name_lists(csv_path: str, mtime: float) -> Dict[str, Tuple[List[str], List[str], set, Dict[str, str]]]:
+    """
+    Precompute the unique customer/project names, their
+    default_process-normalized forms, and exact/lowercase lookup tables for
+    the cached dataset, so fuzzy matching doesn't re-derive and re-normalize
+    candidates on every call.
+    """
+    df = _load_df(csv_path, mtime)
+    names = {}
+    for kind, col in (('customer', 'CustomerName'), ('project', 'ProjectName')):
+        unique = df[col].unique().tolist()
+        processed = [utils.default_process(s) for s in unique]
+        lower_map = {s.lower(): s for s in unique}
+        names[kind] = (unique, processed, set(unique), lower_map)
+    return names
+
+
+def _get_names(kind: str) -> Tuple[List[str], List[str], set, Dict[str, str]]:
+    """
+    Returns the cached (names, processed names, name set, lowercase map) for
+    'customer' or 'project', rebuilding only when dataset.csv has changed.
+    """
+    return _build_name_lists(*_dataset_key())[kind]
+
+
+@lru_cache(maxsize=1)
+def _build_entity_maps(csv_path: str, mtime: float) -> Dict[str, Dict[str, List[str]]]:
+    """
+    Precompute the customer->projects and project->customers maps for the
+    cached dataset with two grouped-unique passes, instead of one Boolean-mask
+    scan of the whole frame per entity.
+    """
+    df = _load_df(csv_path, mtime)
+    customer_projects = (df.groupby('CustomerName', sort=False, observed=True)['ProjectName']
+                         .unique().apply(sorted).to_dict())
+    project_customers = (df.groupby('ProjectName', sort=False, observed=True)['CustomerName']
+                         .unique().apply(sorted).to_dict())
+    return {'customer_projects': customer_projects, 'project_customers': project_customers}
+
+
+def _get_entity_maps() -> Dict[str, Dict[str, List[str]]]:
+    """
+    Returns the cached entity relationship maps, rebuilding only when
+    dataset.csv has changed.
+    """
+    return _build_entity_maps(*_dataset_key())
+
+
+@lru_cache(maxsize=1)
+def _build_group_indices(csv_path: str, mtime: float) -> Dict[str, Dict[str, np.ndarray]]:
+    """
+    name -> row positions for each name column, built in one groupby pass.
+    Single-entity filters become an O(group size) take instead of allocating
+    and scanning an O(rows) Boolean mask per request.
+    """
+    df = _load_df(csv_path, mtime)
+    return {
+        'customer': df.groupby('CustomerName', sort=False, observed=True).indices,
+        'project': df.groupby('ProjectName', sort=False, observed=True).indices,
+    }
+
+
+def _get_group_indices(kind: str) -> Dict[str, np.ndarray]:
+    """
+    Returns the cached name -> row positions map for 'customer' or 'project',
+    rebuilding only when dataset.csv has changed.
+    """
+    return _build_group_indices(*_dataset_key())[kind]
+
+
+@lru_cache(maxsize=4)
+def _unique_names(csv_path: str, mtime: float, col: str) -> Tuple[str, ...]:
+    """
+    Sorted unique values of a name column, memoized per dataset version so
+    repeated resource requests reduce to a dict lookup.
+    """
+    df = _load_df(csv_path, mtime)
+    return tuple(sorted(df[col].unique().tolist()))
+
+
+@lru_cache(maxsize=1)
+def _build_all_entities(csv_path: str, mtime: float) -> Dict[str, List[str]]:
+    """
+    Memoized payload for the entities://all resource, rebuilt only when
+    dataset.csv changes.
+    """
+    maps = _build_entity_maps(csv_path, mtime)
+    return {
+        'customers': list(_unique_names(csv_path, mtime, 'CustomerName')),
+        'projects': list(_unique_names(csv_path, mtime, 'ProjectName')),
+        'customer_projects': maps['customer_projects'],  # Projects associated with each customer
+        'project_customers': maps['project_customers']   # Customers associated with each project
+    }
+
+
+def _resolve_name(query: str, kind: str) -> str:
+    """
+    Resolve a user-supplied customer/project name to its canonical form.
+
+    The query is normalized once and scored against the pre-processed
+    candidate list with processor=None, so rapidfuzz skips per-candidate
+    normalization. The score_cutoff lets the C scorer prune candidates
+    whose length/character-set bounds already rule out reaching the
+    threshold, skipping the full Levenshtein evaluation for most names.
+    Raises ValueError with the closest suggestion when no candidate scores
+    above the cutoff.
+    """
+    names, processed, name_set, lower_map = _get_names(kind)
+    # Fast path: exact (or case-insensitive) hits skip the fuzzy scan entirely
+    if query in name_set:
+        return query
+    canonical = lower_map.get(query.lower())
+    if canonical is not None:
+        return canonical
+    query_processed = utils.default_process(query)
+    hit = process.extractOne(query_processed, processed, scorer=fuzz.WRatio,
+                             processor=None, score_cutoff=80)
+    if hit is None:
+        # Rare miss path: rescan without the cutoff only to build the suggestion
+        suggestion = process.extractOne(query_processed, processed, scorer=fuzz.WRatio,
+                                        processor=None)
+        raise ValueError(f"No close match found for {kind} '{query}'. Did you mean '{names[suggestion[2]]}'?")
+    return names[hit[2]]
+
 @mcp.tool()
-def get_data(metric: str, customer: Optional[str] = None, project: Optional[str] = None) -> Tuple[pd.Series, pd.Series]:
+def get_data(metric: str, customer: Optional[str] = None, project: Optional[str] = None) -> Tuple[Union[np.ndarray, float], Union[np.ndarray, float]]:
     """
     Get financial metrics at customer or project level. If none is provided, return the overall metric.
     Available metrics: 'gross_margin', 'revenue', 'ebitda'
     """
-    script_dir = os.path.dirname(os.path.abspath(__file__))
-    csv_path = os.path.join(script_dir, "dataset.csv")
-
-    df = pd.read_csv(csv_path, low_memory=False)
+    df = _get_df()
     
-    # Filter by customer if provided
+    # Filter by customer and/or project via the precomputed groupby indices:
+    # an O(group size) take instead of a full-column mask scan
+    rows = None
     if customer:
-        customer_names = df['CustomerName'].unique()        
-        best_match = process.extractOne(customer, customer_names)        
-        if best_match[1] > 80:  # Only use match if confidence > 80%
-            customer = best_match[0]
-            df = df.loc[df['CustomerName'] == customer]
-        else:
-            raise ValueError(f"No close match found for customer '{customer}'. Did you mean '{best_match[0]}'?")
-    
-    # Filter by project if provided
+        customer = _resolve_name(customer, 'customer')
+        rows = _get_group_indices('customer')[customer]
     if project:
-        project_names = df['ProjectName'].unique()
-        best_match = process.extractOne(project, project_names)
-        if best_match[1] > 80:
-            project = best_match[0]
-            df = df.loc[df['ProjectName'] == project]
-        else:
-            raise ValueError(f"No close match found for project '{project}'. Did you mean '{best_match[0]}'?")
+        project = _resolve_name(project, 'project')
+        project_rows = _get_group_indices('project')[project]
+        rows = project_rows if rows is None else np.intersect1d(rows, project_rows, assume_unique=True)
+    if rows is not None:
+        df = df.take(rows)
     
     # Calculate the requested metric
     metric = metric.lower()
@@ -48,45 +255,49 @@ def get_data(metric: str, customer: Optional[str] = None, project: Optional[str]
     if not customer and not project:
         total_revenue = df['Revenue'].sum()
         total_cogs = df['COGS'].sum()
-        
+
         if metric == 'gross_margin':
             overall_value = total_revenue - total_cogs
             overall_percentage = overall_value / total_revenue if total_revenue > 0 else 0
-            result_value = pd.Series([overall_value])
-            result_percentage = pd.Series([overall_percentage])
-        
+
         elif metric == 'revenue':
-            result_value = pd.Series([total_revenue])
-            result_percentage = pd.Series([1.0])  # 100% of revenue
-        
+            overall_value = total_revenue
+            overall_percentage = 1.0  # 100% of revenue
+
         elif metric == 'ebitda':
             total_opex = df['OPEX'].sum()
             overall_value = total_revenue - total_cogs - total_opex
             overall_percentage = overall_value / total_revenue if total_revenue > 0 else 0
-            result_value = pd.Series([overall_value])
-            result_percentage = pd.Series([overall_percentage])
-        
+
         else:
             raise ValueError(f"Unknown metric: {metric}. Available metrics are 'gross_margin', 'revenue', 'ebitda'.")
-            
-        return result_value, result_percentage
+
+        # Plain NumPy scalars: serializes the same downstream, without paying
+        # for Series/Index construction per call
+        return np.float64(overall_value), np.float64(overall_percentage)
     
-    # Calculate metrics for specific customer/project
+    # Calculate metrics for specific customer/project on the raw NumPy
+    # arrays: plain SIMD ufuncs, no Series allocation or index alignment
+    rev = df['Revenue'].to_numpy()
+
     if metric == 'gross_margin':
-        result_value = df['Revenue'] - df['COGS']
-        result_percentage = result_value / df['Revenue']
-    
+        result_value = rev - df['COGS'].to_numpy()
+
     elif metric == 'revenue':
-        result_value = df['Revenue']
-        result_percentage = pd.Series([1.0] * len(df))  # 100% of revenue
-    
+        result_value = rev
+
     elif metric == 'ebitda':
-        result_value = df['Revenue'] - df['COGS'] - df['OPEX']
-        result_percentage = result_value / df['Revenue']
-    
+        result_value = rev - df['COGS'].to_numpy() - df['OPEX'].to_numpy()
+
     else:
         raise ValueError(f"Unknown metric: {metric}. Available metrics are 'gross_margin', 'revenue', 'ebitda'.")
-    
+
+    if metric == 'revenue':
+        result_percentage = np.ones_like(rev)  # 100% of revenue
+    else:
+        result_percentage = np.divide(result_value, rev,
+                                      out=np.zeros_like(result_value), where=rev > 0)
+
     return result_value, result_percentage
 
 
@@ -103,10 +314,7 @@ def compare_performance(entity_type: str, metrics: List[str] = None, top_n: int
     Returns:
     - Dictionary with entity names as keys, each containing metric values and percentages
     """
-    script_dir = os.path.dirname(os.path.abspath(__file__))
-    csv_path = os.path.join(script_dir, "dataset.csv")
-
-    df = pd.read_csv(csv_path, low_memory=False)
+    df = _get_df()
     
     # Validate entity_type
     if entity_type.lower() not in ['customer', 'project']:
@@ -114,86 +322,76 @@ def compare_performance(entity_type: str, metrics: List[str] = None, top_n: int
     
     # Set default metrics if not provided
     if metrics is None:
-        metrics = ['revenue', 'gross_margin', 'ebitda']
-    
+        metrics = list(_AVAILABLE_METRICS)
+
     # Validate metrics
-    valid_metrics = ['revenue', 'gross_margin', 'ebitda']
+    valid_metrics = _AVAILABLE_METRICS
     for metric in metrics:
         if metric.lower() not in valid_metrics:
             raise ValueError(f"Unknown metric: {metric}. Available metrics are {', '.join(valid_metrics)}")
     
-    # Group by the specified entity type
+    # Aggregate all three totals per entity in one grouped-sum pass
     entity_col = 'CustomerName' if entity_type.lower() == 'customer' else 'ProjectName'
-    grouped = df.groupby(entity_col)
-    
-    # Calculate aggregated metrics for each entity
+    grouped = df.groupby(entity_col, sort=False, observed=True)[['Revenue', 'COGS', 'OPEX']]
+    if _HAS_NUMBA and len(df) >= _NUMBA_MIN_ROWS:
+        agg = grouped.agg(_numba_sum, engine='numba',
+                          engine_kwargs={'nopython': True, 'nogil': True, 'parallel': True})
+    else:
+        agg = grouped.sum()
+
+    # Derive the metrics as vectorized Series ops over the aggregated sums
+    revenue = agg['Revenue']
+    gross_margin = revenue - agg['COGS']
+    ebitda = gross_margin - agg['OPEX']
+    summary = pd.DataFrame({
+        'revenue': revenue,
+        'gross_margin': gross_margin,
+        'gross_margin_pct': (gross_margin / revenue).where(revenue > 0, 0),
+        'ebitda': ebitda,
+        'ebitda_pct': (ebitda / revenue).where(revenue > 0, 0),
+    })
+
+    # Top-N selection via nlargest is O(E log K); only fall back to a full
+    # O(E log E) sort when every entity is returned
+    if top_n is not None and isinstance(top_n, int) and top_n > 0:
+        summary = summary.nlargest(top_n, 'revenue')
+    else:
+        summary = summary.sort_values('revenue', ascending=False)
+
+    def _metric_entry(name, revenue, gross_margin, gross_margin_pct, ebitda, ebitda_pct):
+        if name == 'revenue':
+            return {'value': revenue, 'percentage': 1.0}  # 100% of itself
+        if name == 'gross_margin':
+            return {'value': gross_margin, 'percentage': gross_margin_pct}
+        return {'value': ebitda, 'percentage': ebitda_pct}
+
+    # Create final results dictionary with only the requested metrics; no
+    # second filtering pass over the built dicts
     results = {}
-    
-    # Create entity summaries
-    entities_summary = []
-    
-    for entity_name, group in grouped:
-        total_revenue = group['Revenue'].sum()
-        total_cogs = group['COGS'].sum()
-        total_opex = group['OPEX'].sum() if 'OPEX' in df.columns else 0
-        
-        # Calculate values for each metric
-        entity_metrics = {
-            'revenue': {
-                'value': total_revenue,
-                'percentage': 1.0  # 100% of itself
-            },
-            'gross_margin': {
-                'value': total_revenue - total_cogs,
-                'percentage': (total_revenue - total_cogs) / total_revenue if total_revenue > 0 else 0
-            },
-            'ebitda': {
-                'value': total_revenue - total_cogs - total_opex,
-                'percentage': (total_revenue - total_cogs - total_opex) / total_revenue if total_revenue > 0 else 0
-            }
+    for row in summary.itertuples():
+        results[row.Index] = {
+            metric: _metric_entry(metric.lower(), row.revenue, row.gross_margin,
+                                  row.gross_margin_pct, row.ebitda, row.ebitda_pct)
+            for metric in metrics
         }
-        
-        entities_summary.append({
-            'name': entity_name,
-            'revenue': total_revenue,
-            'metrics': {metric: entity_metrics[metric] for metric in metrics}
-        })
-    
-    # Sort by revenue
-    entities_summary.sort(key=lambda x: x['revenue'], reverse=True)
-    
-    # Limit to top_n if specified
-    if top_n is not None and isinstance(top_n, int) and top_n > 0:
-        entities_summary = entities_summary[:top_n]
-    
-    # Create final results dictionary
-    for entity in entities_summary:
-        results[entity['name']] = entity['metrics']
-    
+
     # Also include overall company performance
     total_revenue = df['Revenue'].sum()
     total_cogs = df['COGS'].sum()
     total_opex = df['OPEX'].sum() if 'OPEX' in df.columns else 0
-    
+
+    overall_gross_margin = total_revenue - total_cogs
+    overall_ebitda = overall_gross_margin - total_opex
     results['OVERALL'] = {
-        'revenue': {
-            'value': total_revenue,
-            'percentage': 1.0
-        },
-        'gross_margin': {
-            'value': total_revenue - total_cogs,
-            'percentage': (total_revenue - total_cogs) / total_revenue if total_revenue > 0 else 0
-        },
-        'ebitda': {
-            'value': total_revenue - total_cogs - total_opex,
-            'percentage': (total_revenue - total_cogs - total_opex) / total_revenue if total_revenue > 0 else 0
-        }
+        metric: _metric_entry(
+            metric.lower(), total_revenue,
+            overall_gross_margin,
+            overall_gross_margin / total_revenue if total_revenue > 0 else 0,
+            overall_ebitda,
+            overall_ebitda / total_revenue if total_revenue > 0 else 0)
+        for metric in metrics
     }
-    
-    # Filter to only requested metrics
-    for entity in results:
-        results[entity] = {metric: results[entity][metric] for metric in metrics}
-    
+
     return results
 
 
@@ -205,32 +403,7 @@ def list_all_entities() -> Dict[str, List[str]]:
     Returns:
     - Dictionary with information about customers and projects
     """
-    script_dir = os.path.dirname(os.path.abspath(__file__))
-    csv_path = os.path.join(script_dir, "dataset.csv")
-
-    df = pd.read_csv(csv_path, low_memory=False)
-    
-    # Get unique customer and project names
-    customers = sorted(df['CustomerName'].unique().tolist())
-    projects = sorted(df['ProjectName'].unique().tolist())
-    
-    # Create a dictionary with relationships between customers and projects
-    customer_projects = {}
-    for customer in customers:
-        customer_df = df[df['CustomerName'] == customer]
-        customer_projects[customer] = sorted(customer_df['ProjectName'].unique().tolist())
-    
-    project_customers = {}
-    for project in projects:
-        project_df = df[df['ProjectName'] == project]
-        project_customers[project] = sorted(project_df['CustomerName'].unique().tolist())
-    
-    return {
-        'customers': customers,
-        'projects': projects,
-        'customer_projects': customer_projects,  # Projects associated with each customer
-        'project_customers': project_customers   # Customers associated with each project
-    }
+    return _build_all_entities(*_dataset_key())
 
 
 @mcp.resource("entities://customers")
@@ -238,11 +411,7 @@ def list_customers() -> List[str]:
     """
     Lists all available customers in the dataset.
     """
-    script_dir = os.path.dirname(os.path.abspath(__file__))
-    csv_path = os.path.join(script_dir, "dataset.csv")
-
-    df = pd.read_csv(csv_path, low_memory=False)
-    return sorted(df['CustomerName'].unique().tolist())
+    return list(_unique_names(*_dataset_key(), 'CustomerName'))
 
 
 @mcp.resource("entities://projects")
@@ -250,11 +419,7 @@ def list_projects() -> List[str]:
     """
     Lists all available projects in the dataset.
     """
-    script_dir = os.path.dirname(os.path.abspath(__file__))
-    csv_path = os.path.join(script_dir, "dataset.csv")
-
-    df = pd.read_csv(csv_path, low_memory=False)
-    return sorted(df['ProjectName'].unique().tolist())
+    return list(_unique_names(*_dataset_key(), 'ProjectName'))
 
 
 @mcp.resource("entities://customer/{customer_name}/projects")
@@ -262,21 +427,10 @@ def list_customer_projects(customer_name: str) -> List[str]:
     """
     Lists all projects associated with a specific customer.
     """
-    script_dir = os.path.dirname(os.path.abspath(__file__))
-    csv_path = os.path.join(script_dir, "dataset.csv")
-
-    df = pd.read_csv(csv_path, low_memory=False)
-    
-    # Find the best match for the customer name
-    customer_names = df['CustomerName'].unique()
-    best_match = process.extractOne(customer_name, customer_names)
-    
-    if best_match[1] > 80:  # Only use match if confidence > 80%
-        customer = best_match[0]
-        customer_df = df[df['CustomerName'] == customer]
-        return sorted(customer_df['ProjectName'].unique().tolist())
-    else:
-        raise ValueError(f"No close match found for customer '{customer_name}'. Did you mean '{best_match[0]}'?")
+    # Find the best match for the customer name, then the precomputed
+    # relationship map makes this a dict lookup
+    customer = _resolve_name(customer_name, 'customer')
+    return _get_entity_maps()['customer_projects'][customer]
 
 
 @mcp.resource("entities://project/{project_name}/customers")
@@ -284,21 +438,10 @@ def list_project_customers(project_name: str) -> List[str]:
     """
     Lists all customers associated with a specific project.
     """
-    script_dir = os.path.dirname(os.path.abspath(__file__))
-    csv_path = os.path.join(script_dir, "dataset.csv")
-
-    df = pd.read_csv(csv_path, low_memory=False)
-    
-    # Find the best match for the project name
-    project_names = df['ProjectName'].unique()
-    best_match = process.extractOne(project_name, project_names)
-    
-    if best_match[1] > 80:  # Only use match if confidence > 80%
-        project = best_match[0]
-        project_df = df[df['ProjectName'] == project]
-        return sorted(project_df['CustomerName'].unique().tolist())
-    else:
-        raise ValueError(f"No close match found for project '{project_name}'. Did you mean '{best_match[0]}'?")
+    # Find the best match for the project name, then the precomputed
+    # relationship map makes this a dict lookup
+    project = _resolve_name(project_name, 'project')
+    return _get_entity_maps()['project_customers'][project]
 
 
 @mcp.resource("metrics://available")
@@ -306,7 +449,7 @@ def list_available_metrics() -> List[str]:
     """
     Lists all available financial metrics that can be analyzed.
     """
-    return ['revenue', 'gross_margin', 'ebitda']
+    return list(_AVAILABLE_METRICS)
 
 
 @mcp.prompt()